@@ -25,15 +25,96 @@ intents = discord.Intents.default()
 client = discord.Client(intents=intents)
 
 # ========== UTILITIES ==========
-async def send_terminal_messages(msg: str):
-    await client.wait_until_ready()
-    channel = client.get_channel(CHANNEL_ID)
+DISCORD_MESSAGE_LIMIT = 2000
+
+
+def pack_lines(lines, limit=DISCORD_MESSAGE_LIMIT):
+    # Pack lines into as few messages as fit under Discord's character limit
+    messages = []
+    current = ""
+    for line in lines:
+        while len(line) > limit:  # A single oversized line gets split on its own
+            if current:
+                messages.append(current)
+                current = ""
+            messages.append(line[:limit])
+            line = line[limit:]
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) > limit:
+            messages.append(current)
+            current = line
+        else:
+            current = candidate
+    if current:
+        messages.append(current)
+    return messages
+
+
+class DiscordPublisher:
+    # Background queue that owns the channel and sends packed messages.
+    # discord.py reads the X-RateLimit headers and waits on the right bucket
+    # for every send, so there is no fixed sleep between messages here.
+    def __init__(self, client, channel_id):
+        self.client = client
+        self.channel_id = int(channel_id)
+        self.channel = None
+        self.queue = asyncio.Queue()
+        self._task = None
+
+    async def _resolve_channel(self):
+        await self.client.wait_until_ready()
+        self.channel = self.client.get_channel(self.channel_id)
+        if self.channel is None:
+            try:
+                self.channel = await self.client.fetch_channel(self.channel_id)
+            except discord.DiscordException as e:
+                print(f"⚠️ Channel not found: {e}")
+
+    async def _run(self):
+        await self._resolve_channel()
+        while True:
+            lines = [await self.queue.get()]
+            while not self.queue.empty():  # Grab everything already waiting so it packs together
+                lines.append(self.queue.get_nowait())
+            try:
+                if self.channel is None:
+                    continue
+                for msg in pack_lines(lines):
+                    try:
+                        await self.channel.send(msg)
+                    except discord.HTTPException as e:
+                        print(f"⚠️ Failed to send message: {e}")
+            finally:
+                for _ in lines:
+                    self.queue.task_done()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def publish(self, *lines):
+        # Never blocks; the background task does the sending
+        for line in lines:
+            self.queue.put_nowait(line)
+
+    async def close(self):
+        if self._task is None:
+            return
+        # If the sender died, the queue will never drain, so wait on both
+        drained = asyncio.create_task(self.queue.join())
+        await asyncio.wait((drained, self._task), return_when=asyncio.FIRST_COMPLETED)
+        drained.cancel()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Discord publisher stopped: {e}")
+        self._task = None
 
-    if not channel:
-        print("⚠️ Channel not found.")
-        return
 
-    await channel.send(msg)
+publisher = DiscordPublisher(client, CHANNEL_ID)
 
 # ========== PREDICTION WORKFLOW ==========
 async def run_predictions():
@@ -43,7 +124,7 @@ async def run_predictions():
         model = joblib.load(MODEL_PATH)
     except Exception as e:
         print(f"❌ Failed to load model: {e}")
-        await send_terminal_messages("❌ Could not load prediction model.")
+        publisher.publish("❌ Could not load prediction model.")
         return
 
     try:
@@ -53,11 +134,11 @@ async def run_predictions():
         df = preprocess_combined(cl_data, cg_data, cmc_data)
     except Exception as e:
         print(f"❌ Failed to fetch or preprocess data: {e}")
-        await send_terminal_messages("❌ Data fetch/preprocess error.")
+        publisher.publish("❌ Data fetch/preprocess error.")
         return
 
     if df.empty:
-        await send_terminal_messages("⚠️ No valid coins to predict.")
+        publisher.publish("⚠️ No valid coins to predict.")
         return
 
     try:
@@ -65,7 +146,7 @@ async def run_predictions():
         preds = model.predict(X)
         probs = model.predict_proba(X)
     except Exception as e:
-        await send_terminal_messages(f"❌ Prediction failed: {e}")
+        publisher.publish(f"❌ Prediction failed: {e}")
         return
 
     coin_symbols = [coin['symbol'].lower() for coin in cg_data]
@@ -85,18 +166,16 @@ async def run_predictions():
         except Exception as e:
             results.append(f"⚠️ Error with index {idx}: {e}")
 
-    # Batch send results (avoid spam)
-    batch_size = 10
-    for i in range(0, len(results), batch_size):
-        msg = "\n".join(results[i:i + batch_size])
-        await send_terminal_messages(msg)
-        await asyncio.sleep(1.5)  # Sleep to respect Discord rate limits
+    # Queued lines are packed into as few messages as possible by the publisher
+    publisher.publish(*results)
 
 # ========== DISCORD HOOK ==========
 @client.event
 async def on_ready():
     print(f"✅ Logged in as {client.user}")
+    publisher.start()
     await run_predictions()
+    await publisher.close()  # Flush queued messages before exiting
     await client.close()  # Exit after sending predictions (optional)
 
 # ========== RUN ==========
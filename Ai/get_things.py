@@ -1,5 +1,6 @@
 import requests
 import os
+import sys
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 import joblib
@@ -149,19 +150,31 @@ def preprocess_combined(cl_data, cg_data, cmc_data):
 
 # ========== TRAINING ==========
 
-def train_and_save(df):
+def train_and_save(df, n_jobs=-1, model_path='crypto_investment_model.pkl', update=False):
     if df.empty:
         print("⚠️ No data passed the filter. Check filtering logic or expand criteria.")
         return
 
     print("📊 Class distribution:\n", df['investment_grade'].value_counts())
 
+    # Imported here so ai.py can use the fetch/preprocess helpers without imbalanced-learn
+    from training import can_cross_validate, load_or_search, search
+
     X = df.drop('investment_grade', axis=1)
     y = df['investment_grade']
-    model = RandomForestClassifier(n_estimators=100, random_state=42)
-    model.fit(X, y)
-    joblib.dump(model, 'crypto_investment_model.pkl')
-    print("✅ Model saved as crypto_investment_model.pkl")
+    if can_cross_validate(y):
+        if update:
+            # Grow the saved model with this snapshot (capped in training.MAX_TREES)
+            model = load_or_search(model_path, X, y, n_jobs=n_jobs)
+        else:
+            model, _ = search(X, y, n_jobs=n_jobs)
+    else:
+        # Too few samples per class to cross-validate a search; keep the old fixed model
+        print("⚠️ Not enough samples per class for a search, fitting default forest.")
+        model = RandomForestClassifier(n_estimators=100, random_state=42)
+        model.fit(X, y)
+    joblib.dump(model, model_path)
+    print(f"✅ Model saved as {model_path}")
 
 # ========== MAIN SCRIPT ==========
 
@@ -182,7 +195,7 @@ if __name__ == "__main__":
         df = preprocess_combined(coinlore, cg_filtered, coinmarketcap)
         print(df.head())
 
-        train_and_save(df)
+        train_and_save(df, update="--update" in sys.argv)
 
     except Exception as e:
         print(f"❌ Fatal error: {e}")
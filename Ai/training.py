@@ -0,0 +1,178 @@
+import argparse
+import os
+import time
+
+import joblib
+import pandas as pd
+from imblearn.over_sampling import SMOTE
+from imblearn.pipeline import Pipeline
+from sklearn.pipeline import Pipeline as ModelPipeline
+from joblib import Memory, parallel_backend
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import RandomizedSearchCV, StratifiedKFold
+from sklearn.preprocessing import MinMaxScaler
+
+# ========== CONFIG ==========
+CACHE_DIR = os.getenv("TRAINING_CACHE_DIR", ".training_cache")
+CV_FOLDS = 5
+SEARCH_ITERATIONS = 20
+EXTRA_TREES = 50
+MAX_TREES = 1000  # Past this, warm refits stop and the next update runs a fresh search
+SNIPER_FEATURES = ['Market_Cap_(USD)', 'Trading_Volume_(24h)', 'Token_Liquidity_(USD)', 'Returns_(%)']
+
+PARAM_SPACE = {
+    'model__n_estimators': [100, 200, 400],
+    'model__max_depth': [None, 8, 16, 32],
+    'model__min_samples_leaf': [1, 2, 4],
+    'model__max_features': ['sqrt', 'log2', None],
+    'model__class_weight': [None, 'balanced'],
+}
+
+# Fitted scalers (pipeline steps) and prepared feature matrices are kept on disk between runs
+memory = Memory(CACHE_DIR, verbose=0)
+
+# ========== FEATURES ==========
+
+@memory.cache
+def _sniper_features(csv_path, mtime):
+    # Same preparation as the notebook; mtime is part of the cache key so an updated CSV is re-read
+    df = pd.read_csv(csv_path)
+    df.drop_duplicates(inplace=True)
+    df.fillna(0, inplace=True)
+    X = df[SNIPER_FEATURES]
+    # The label thresholds were chosen on min-max scaled columns, so rescale just to label.
+    # The pipeline's own scaler is refit inside each fold.
+    scaled = (X - X.min()) / (X.max() - X.min()).replace(0, 1)
+    y = ((scaled['Returns_(%)'] > 0.5) & (scaled['Token_Liquidity_(USD)'] > 0.3)).astype(int)
+    return X, y
+
+
+def load_sniper_features(csv_path):
+    return _sniper_features(os.path.abspath(csv_path), os.path.getmtime(csv_path))
+
+# ========== PIPELINE ==========
+
+def build_pipeline(y, folds=CV_FOLDS, random_state=42):
+    # SMOTE lives inside the pipeline, so it only ever sees the training part of a fold
+    minority = int(y.value_counts().min())
+    k_neighbors = max(1, min(5, minority * (folds - 1) // folds - 1))
+    return Pipeline([
+        ('scaler', MinMaxScaler()),
+        ('smote', SMOTE(k_neighbors=k_neighbors, random_state=random_state)),
+        ('model', RandomForestClassifier(random_state=random_state)),
+    ], memory=memory)
+
+
+def search(X, y, n_jobs=-1, folds=CV_FOLDS, n_iter=SEARCH_ITERATIONS, random_state=42):
+    # Candidates x folds are fitted across a process pool (loky); each fit uses one core
+    # so the pool is not oversubscribed
+    cv = StratifiedKFold(n_splits=folds, shuffle=True, random_state=random_state)
+    finder = RandomizedSearchCV(
+        build_pipeline(y, folds, random_state),
+        PARAM_SPACE,
+        n_iter=n_iter,
+        scoring='f1',
+        cv=cv,
+        n_jobs=n_jobs,
+        random_state=random_state,
+    )
+    start = time.perf_counter()
+    with parallel_backend('loky'):
+        finder.fit(X, y)
+    elapsed = time.perf_counter() - start
+    print(f"🔍 Search done in {elapsed:.1f}s, best f1={finder.best_score_:.3f}")
+    print(f"   Best params: {finder.best_params_}")
+    return export_pipeline(finder.best_estimator_), elapsed
+
+
+def export_pipeline(pipeline):
+    # What gets saved: just the fitted scaler and forest in a plain sklearn Pipeline.
+    # SMOTE does nothing at predict time, and leaving it (and the cache) out means
+    # loading the model only needs scikit-learn.
+    return ModelPipeline([
+        ('scaler', pipeline.named_steps['scaler']),
+        ('model', pipeline.named_steps['model']),
+    ])
+
+
+def can_cross_validate(y, folds=CV_FOLDS):
+    counts = y.value_counts()
+    return len(counts) > 1 and counts.min() >= folds
+
+
+def warm_refit(pipeline, X_new, y_new, extra_trees=EXTRA_TREES, random_state=42):
+    # New snapshots: grow the forest on them without refitting the scaler. The existing
+    # trees split on values scaled the old way, so the new rows go through that same
+    # fitted scaler, get resampled, and only the extra trees are trained on them.
+    if y_new.nunique() < 2:
+        print("⚠️ New snapshot has a single class, skipping refit.")
+        return pipeline
+    scaler = pipeline.named_steps['scaler']
+    model = pipeline.named_steps['model']
+    X_scaled = scaler.transform(X_new)
+    minority = int(y_new.value_counts().min())
+    if minority > 1:
+        smote = SMOTE(k_neighbors=min(5, minority - 1), random_state=random_state)
+        X_scaled, y_new = smote.fit_resample(X_scaled, y_new)
+        model.set_params(class_weight=None)  # Already balanced; "balanced" presets misbehave with warm_start
+    model.set_params(warm_start=True, n_estimators=model.n_estimators + extra_trees)
+    start = time.perf_counter()
+    model.fit(X_scaled, y_new)
+    print(f"🌱 Added {extra_trees} trees in {time.perf_counter() - start:.1f}s "
+          f"({model.n_estimators} total)")
+    return pipeline
+
+
+def load_or_search(model_path, X, y, n_jobs=-1, extra_trees=EXTRA_TREES, **search_kwargs):
+    # Grow the saved model when there is one and it is under MAX_TREES; otherwise run the full search
+    if os.path.exists(model_path):
+        pipeline = joblib.load(model_path)
+        if not (isinstance(pipeline, ModelPipeline) and list(pipeline.feature_names_in_) == list(X.columns)):
+            print(f"⚠️ {model_path} is not a compatible pipeline, running a full search.")
+        elif pipeline.named_steps['model'].n_estimators + extra_trees > MAX_TREES:
+            print(f"⚠️ {model_path} has reached {MAX_TREES} trees, running a full search.")
+        else:
+            return warm_refit(pipeline, X, y, extra_trees)
+    model, _ = search(X, y, n_jobs=n_jobs, **search_kwargs)
+    return model
+
+# ========== SCALING REPORT ==========
+
+def scaling_report(X, y, core_counts=None, **search_kwargs):
+    if core_counts is None:
+        cpus = os.cpu_count() or 1
+        core_counts = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+    memory.clear(warn=False)  # Cold cache for every run so timings are comparable
+    rows = []
+    baseline = None
+    for cores in core_counts:
+        _, elapsed = search(X, y, n_jobs=cores, **search_kwargs)
+        memory.clear(warn=False)
+        baseline = baseline or elapsed * core_counts[0]
+        speedup = baseline / elapsed
+        rows.append({'cores': cores, 'seconds': round(elapsed, 2),
+                     'speedup': round(speedup, 2), 'efficiency': round(speedup / cores, 2)})
+    report = pd.DataFrame(rows)
+    print("📈 Scaling report:\n", report.to_string(index=False))
+    return report
+
+# ========== MAIN SCRIPT ==========
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the sniper classifier")
+    parser.add_argument("csv_path", help="e.g. final_data_solana_2023.csv")
+    parser.add_argument("--cores", type=int, nargs="+", help="print a scaling report for these core counts")
+    parser.add_argument("--update", action="store_true",
+                        help="grow the saved sniper_model.pkl with this CSV instead of searching from scratch")
+    args = parser.parse_args()
+
+    X, y = load_sniper_features(args.csv_path)
+    print("📊 Class distribution:\n", y.value_counts())
+    if args.cores:
+        scaling_report(X, y, args.cores)
+    if args.update:
+        model = load_or_search('sniper_model.pkl', X, y)
+    else:
+        model, _ = search(X, y)
+    joblib.dump(model, 'sniper_model.pkl')
+    print("✅ Model saved as sniper_model.pkl")
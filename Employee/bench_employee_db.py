@@ -0,0 +1,94 @@
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from employee_db import CREATE_TABLE, EmployeeStore
+
+# Compares the old access pattern (no name index, rollback journal, reload every name
+# after each insert) with EmployeeStore on a roster of ROWS employees.
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+OPS = 200
+
+
+def seed(path):
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(CREATE_TABLE)
+        conn.executemany(
+            "INSERT INTO employee (id, name, salary) VALUES (?, ?, ?)",
+            ((i, f"employee_{i}", 30_000 + i % 90_000) for i in range(1, ROWS + 1)),
+        )
+    conn.close()
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:10.1f} ms  ({elapsed / OPS * 1e6:8.1f} µs/op)")
+    return elapsed
+
+
+def bench_legacy(path):
+    conn = sqlite3.connect(path)
+    c = conn.cursor()
+    picks = random.Random(1).sample(range(1, ROWS + 1), OPS)
+
+    def inserts():
+        for i in range(OPS):
+            with conn:
+                c.execute("INSERT INTO employee (id,name,salary) VALUES (?,?,?)", (ROWS + 1 + i, f"new_{i}", 1))
+                [name[0] for name in c.execute("SELECT name FROM employee").fetchall()]
+
+    def updates():
+        for i in picks:
+            with conn:
+                c.execute("UPDATE employee SET salary = ? WHERE name = ?", (1, f"employee_{i}"))
+
+    def deletes():
+        for i in picks:
+            with conn:
+                c.execute("DELETE FROM employee WHERE name = ?", (f"employee_{i}",))
+
+    results = [timed("legacy insert + reload", inserts), timed("legacy update by name", updates),
+               timed("legacy delete by name", deletes)]
+    conn.close()
+    return results
+
+
+def bench_store(path):
+    store = EmployeeStore(path)
+    picks = random.Random(1).sample(range(1, ROWS + 1), OPS)
+
+    def inserts():
+        for i in range(OPS):
+            store.add(ROWS + 1 + i, f"new_{i}", 1)
+
+    def updates():
+        for i in picks:
+            store.edit(f"employee_{i}", new_salary=1)
+
+    def deletes():
+        for i in picks:
+            store.remove(f"employee_{i}")
+
+    results = [timed("store insert", inserts), timed("store update by name", updates),
+               timed("store delete by name", deletes)]
+    store.close()
+    return results
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, "legacy.db")
+        store_path = os.path.join(tmp, "store.db")
+        print(f"Seeding {ROWS} rows...")
+        seed(legacy_path)
+        seed(store_path)
+        legacy = bench_legacy(legacy_path)
+        store = bench_store(store_path)
+        for op, old, new in zip(("insert", "update", "delete"), legacy, store):
+            print(f"{op:<8} speedup: {old / new:6.1f}x")
@@ -1,61 +1,237 @@
+import queue
 import sqlite3
+import threading
 from tkinter import *
+from tkinter import filedialog
 from tkinter import messagebox
 from tkinter import ttk
-employee_list = []
+from employee_db import DBWorker, PAGE_SIZE, SEARCH_LIMIT, SORT_COLUMNS, export_csv, import_csv
+SEARCH_DELAY_MS = 200
+POLL_MS = 30
 def on_closing():
     if messagebox.askyesno("Confirmation", "Sure you want to exit?"):
         tk.destroy()  
     else:
         pass
 def c_init():
-    conn = sqlite3.connect('employee_track.db')
-    return conn, conn.cursor()
+    return DBWorker('employee_track.db')
 
-def add_employee(id_entry,name_entry,salary_entry):
+def pump_results():
+    # Runs queued DB callbacks on the Tk thread; always reschedules so one bad
+    # callback can't stop every later result from being delivered
     try:
-        id_val = id_entry.get().strip()
-        name_val = name_entry.get().strip()
-        salary_val = salary_entry.get().strip()
-        with conn:
-            c.execute("""INSERT INTO employee (id,name,salary) VALUES (?,?,?)""",(id_val,name_val,salary_val))
-            global employee_list
-            employee_list = [name[0] for name in c.execute("SELECT name FROM employee").fetchall()]
-    
-    except sqlite3.IntegrityError:
-        messagebox.showerror("Error","Duplicate name")
+        worker.poll()
+    finally:
+        tk.after(POLL_MS, pump_results)
+
+def show_db_error(error, duplicate_message):
+    if isinstance(error, sqlite3.IntegrityError):
+        messagebox.showerror("Error", duplicate_message)
+    elif isinstance(error, ValueError):
+        messagebox.showerror("Error", "ID and salary must be whole numbers")
+    else:
+        messagebox.showerror("Error", str(error))
+
+def add_employee(id_entry,name_entry,salary_entry):
+    id_val = id_entry.get().strip()
+    name_val = name_entry.get().strip()
+    salary_val = salary_entry.get().strip()
+    worker.submit("add", id_val, name_val, salary_val,
+                  errback=lambda e: show_db_error(e, "Duplicate ID or name"))
         
+class EmployeeTable:
+    # Treeview that pulls rows from the store one page at a time as the user scrolls,
+    # so opening the view costs one page no matter how big the table is
+    def __init__(self, parent):
+        self.sort = "id"
+        self.descending = False
+        self.last_row = None
+        self.exhausted = False
+        self.loading = False
+        self.generation = 0  # Bumped on reload so late pages from an old sort are dropped
+        self.tree = ttk.Treeview(parent, columns=SORT_COLUMNS, show="headings")
+        for col in SORT_COLUMNS:
+            self.tree.heading(col, text=col, command=lambda col=col: self.sort_by(col))
+            self.tree.column(col, width=140, anchor=W)
+        scrollbar = ttk.Scrollbar(parent, orient=VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=lambda first, last: self.on_scroll(scrollbar, first, last))
+        scrollbar.pack(side=RIGHT, fill=Y)
+        self.tree.pack(expand=1, fill='both')
+
+    def reload(self):
+        self.tree.delete(*self.tree.get_children())
+        self.last_row = None
+        self.exhausted = False
+        self.loading = False
+        self.generation += 1
+        self.load_page()
+
+    def load_page(self):
+        if self.exhausted or self.loading:
+            return
+        self.loading = True
+        generation = self.generation
+        worker.submit("page", self.sort, self.descending, self.last_row,
+                      callback=lambda rows: self.show_page(generation, rows),
+                      errback=lambda e: self.page_failed(generation, e))
+
+    def page_failed(self, generation, error):
+        # Let the next scroll try again, e.g. once a bulk import releases the lock
+        if generation == self.generation:
+            self.loading = False
+        messagebox.showerror("Error", f"Could not load employees: {error}")
+
+    def show_page(self, generation, rows):
+        if generation != self.generation:
+            return
+        self.loading = False
+        if len(rows) < PAGE_SIZE:
+            self.exhausted = True
+        for row in rows:
+            self.tree.insert("", END, values=row)
+        if rows:
+            self.last_row = rows[-1]
+
+    def on_scroll(self, scrollbar, first, last):
+        scrollbar.set(first, last)
+        if float(last) > 0.9:
+            self.load_page()
+
+    def sort_by(self, col):
+        self.descending = not self.descending if col == self.sort else False
+        self.sort = col
+        for name in SORT_COLUMNS:
+            arrow = (" ▼" if self.descending else " ▲") if name == self.sort else ""
+            self.tree.heading(name, text=name + arrow)
+        self.reload()
+
 def see_employee(view_employees):
-    all_employees = c.execute("SELECT * FROM employee").fetchall()
-    formatted_rows = [" | ".join(map(str, row)) for row in all_employees]
-    view_employees.configure(text="\n".join(formatted_rows))
+    view_employees.reload()
+
+class EmployeeSearch:
+    # Type-ahead box: each keystroke restarts a short timer, and only the last one
+    # runs an indexed prefix query for the top matches
+    def __init__(self, parent, click):
+        self.click = click
+        self.pending = None
+        self.matches = []
+        self.text = StringVar()
+        self.entry = Entry(parent, textvariable=self.text)
+        self.results = Listbox(parent, height=5, exportselection=False)
+        self.entry.bind("<KeyRelease>", self.schedule)
+        self.results.bind("<<ListboxSelect>>", self.select)
+
+    def schedule(self, event=None):
+        if self.pending is not None:
+            tk.after_cancel(self.pending)
+        self.pending = tk.after(SEARCH_DELAY_MS, self.refresh)
 
-def edit_employee(click, salary1_entry, name1_entry):
+    def refresh(self):
+        self.pending = None
+        text = self.text.get()
+        worker.submit("search", text, SEARCH_LIMIT, callback=lambda matches: self.show(text, matches))
+
+    def show(self, text, matches):
+        if text != self.text.get():
+            return  # The user kept typing; a newer search is on its way
+        self.matches = matches
+        self.results.delete(0, END)
+        for emp_id, name in self.matches:
+            self.results.insert(END, f"{emp_id} | {name}")
+
+    def select(self, event=None):
+        picked = self.results.curselection()
+        if picked:
+            self.click.set(self.matches[picked[0]][1])
+
+def edit_employee(click, salary1_entry, name1_entry, on_done=None):
     chosen = click.get().strip()
     new_salary = salary1_entry.get().strip()
     new_name = name1_entry.get().strip()
-    
-    with conn:
-        if new_name != "" and new_salary != "":
-            c.execute("UPDATE employee SET salary = ?, name = ? WHERE name = ?", (new_salary, new_name, chosen))
-        elif new_salary == "":
-            c.execute("UPDATE employee SET name = ? WHERE name = ?", (new_name, chosen))
-        elif new_name == "":
-            c.execute("UPDATE employee SET salary = ? WHERE name = ?", (new_salary, chosen))
-
-    conn.commit()
-def remove_employee(click):
+
+    def done(changed):
+        if changed and new_name != "":
+            click.set(new_name)
+        if on_done:
+            on_done()
+
+    worker.submit("edit", chosen, new_name, new_salary, callback=done,
+                  errback=lambda e: show_db_error(e, "Duplicate name"))
+
+def remove_employee(click, on_done=None):
     chosen = click.get().strip()
     exit_choice =  messagebox.askquestion("Confirm","Are you sure you want to delete?")
     if exit_choice == 'yes':
-        with conn:
-            c.execute("DELETE FROM employee WHERE name = ?", (chosen))
-            conn.commit()
+        click.set("Select")
+        worker.submit("remove", chosen, callback=lambda removed: on_done and on_done())
     else:
         pass
     
     
 
+def run_bulk(job, path, progress_bar, status, buttons, on_done=None):
+    # Runs an import/export on a thread; the Tk side only polls a queue with after()
+    updates = queue.Queue()
+
+    def work():
+        try:
+            result = job(path, worker.path, progress=lambda frac: updates.put(("progress", frac)))
+            updates.put(("done", result))
+        except Exception as e:
+            updates.put(("error", e))
+
+    def poll():
+        try:
+            while True:
+                kind, value = updates.get_nowait()
+                if kind == "progress":
+                    progress_bar["value"] = value * 100
+                elif kind == "error":
+                    finish()
+                    status.configure(text="Failed")
+                    messagebox.showerror("Error", str(value))
+                    return
+                else:
+                    finish()
+                    report(value)
+                    if on_done:
+                        on_done()
+                    return
+        except queue.Empty:
+            pass
+        tk.after(100, poll)
+
+    def finish():
+        for button in buttons:
+            button.configure(state=NORMAL)
+
+    def report(result):
+        if isinstance(result, dict):
+            status.configure(text=f"Imported {result['inserted']} employees")
+            skipped = result["duplicates"] + result["invalid"]
+            if skipped:
+                messagebox.showwarning("Import", f"Skipped {result['duplicates']} duplicate IDs or names "
+                                                 f"and {result['invalid']} invalid rows.")
+        else:
+            status.configure(text=f"Exported {result} employees")
+
+    for button in buttons:
+        button.configure(state=DISABLED)
+    progress_bar["value"] = 0
+    status.configure(text="Working...")
+    threading.Thread(target=work, daemon=True).start()
+    poll()
+
+def import_employees(progress_bar, status, buttons, view_employees):
+    path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
+    if path:
+        run_bulk(import_csv, path, progress_bar, status, buttons, on_done=view_employees.reload)
+
+def export_employees(progress_bar, status, buttons):
+    path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
+    if path:
+        run_bulk(export_csv, path, progress_bar, status, buttons)
+
 def gui():
     tk.title("Manage Employees")
     tk.geometry("500x400")
@@ -64,9 +240,11 @@ def gui():
     add_tab = Frame(notebook)
     edit_tab = Frame(notebook)
     view_tab = Frame(notebook)
+    bulk_tab = Frame(notebook)
     notebook.add(add_tab, text="Add Employee")
     notebook.add(edit_tab, text="Edit Employees")
     notebook.add(view_tab, text="View Employees")
+    notebook.add(bulk_tab, text="Import/Export")
     notebook.pack(expand=1, fill='both')
     Label(add_tab, text="Employee ID").grid(row=0, column=0, padx=10, pady=10)
     Label(add_tab, text="Name").grid(row=1, column=0, padx=10, pady=10)
@@ -81,13 +259,26 @@ def gui():
     add_button = Button(add_tab,text="Confirm",command = lambda: add_employee(id_entry, name_entry,salary_entry)) .grid(row=3,column=0,pady=10)
     update_view = Button(view_tab,text = "Update Employee Data", command = lambda : see_employee(view_employees))
     update_view.pack(pady=5)
-    employee_roles = Label(view_tab,text = "ID | name | salary",font = ("Helvetica",24))
-    employee_roles.pack(pady=10)
-    view_employees = Label(view_tab,font=("Helvetica",23))
-    view_employees.pack(pady=10)
+    view_employees = EmployeeTable(view_tab)
+    view_employees.load_page()
+    bulk_progress = ttk.Progressbar(bulk_tab, length=300, maximum=100)
+    bulk_status = Label(bulk_tab, text="")
+    import_button = Button(bulk_tab, text="Import CSV")
+    export_button = Button(bulk_tab, text="Export CSV")
+    bulk_buttons = (import_button, export_button)
+    import_button.configure(command=lambda: import_employees(bulk_progress, bulk_status, bulk_buttons, view_employees))
+    export_button.configure(command=lambda: export_employees(bulk_progress, bulk_status, bulk_buttons))
+    import_button.grid(row=0, column=0, padx=10, pady=10)
+    export_button.grid(row=0, column=1, padx=10, pady=10)
+    bulk_progress.grid(row=1, column=0, columnspan=2, padx=10, pady=10)
+    bulk_status.grid(row=2, column=0, columnspan=2, padx=10, pady=10)
     click = StringVar()
     click.set("Select")
-    OptionMenu(edit_tab, click , *employee_list ).grid(row = 3,column = 1,pady=10)
+    employee_search = EmployeeSearch(edit_tab, click)
+    Label(edit_tab, text="Find Employee").grid(row=0, column=0, padx=10, pady=10)
+    employee_search.entry.grid(row=0, column=1, padx=10, pady=10)
+    Label(edit_tab, textvariable=click).grid(row=3, column=0, padx=10, pady=10)
+    employee_search.results.grid(row=3, column=1, padx=10, pady=10)
     Label(edit_tab, text="Change Name").grid(row=1, column=0, padx=10, pady=10)
     Label(edit_tab, text="Change Salary").grid(row=2, column=0, padx=10, pady=10)
     global name1_entry,salary1_entry
@@ -95,24 +286,16 @@ def gui():
     salary1_entry = Entry(edit_tab)
     name1_entry.grid(row=1, column=1, padx=10, pady=10)
     salary1_entry.grid(row=2, column=1, padx=10, pady=10)
-    remove_button = Button(edit_tab , text = "Remove Employee",command = lambda: remove_employee(click)).grid(row = 4, column = 1 , padx=5,pady=10)
-    add_button1 = Button(edit_tab,text="Confirm Edit",command = lambda: edit_employee(click,salary1_entry,name1_entry)) .grid(row=4,column=0,pady=10)
+    remove_button = Button(edit_tab , text = "Remove Employee",command = lambda: remove_employee(click, employee_search.refresh)).grid(row = 4, column = 1 , padx=5,pady=10)
+    add_button1 = Button(edit_tab,text="Confirm Edit",command = lambda: edit_employee(click,salary1_entry,name1_entry,employee_search.refresh)) .grid(row=4,column=0,pady=10)
 
 
 
 if __name__ == '__main__':
     tk = Tk()
     tk.protocol("WM_DELETE_WINDOW",on_closing)
-    conn, c = c_init()
-    employee_list = [name[0] for name in c.execute("SELECT name FROM employee").fetchall()]
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS employee (
-            id INTEGER NOT NULL PRIMARY KEY,
-            name TEXT NOT NULL,
-            salary INTEGER NOT NULL
-            
-        );
-    """)
+    worker = c_init()
     gui()
+    pump_results()
     tk.mainloop()
-    conn.close()
+    worker.close()
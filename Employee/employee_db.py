@@ -0,0 +1,372 @@
+import csv
+import itertools
+import os
+import queue
+import sqlite3
+import threading
+import traceback
+
+DB_PATH = 'employee_track.db'
+
+# Tuned for a single desktop app: WAL lets readers run while a write is in progress,
+# and NORMAL sync is safe under WAL (only the last transaction can be lost on power cut).
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",      # 64 MB page cache
+    "PRAGMA mmap_size = 268435456",    # 256 MB memory-mapped I/O
+    "PRAGMA busy_timeout = 5000",
+)
+
+CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS employee (
+        id INTEGER NOT NULL PRIMARY KEY,
+        name TEXT NOT NULL,
+        salary INTEGER NOT NULL
+    )
+"""
+CREATE_NAME_UNIQUE = "CREATE UNIQUE INDEX IF NOT EXISTS idx_employee_name ON employee(name)"
+CREATE_NAME_INDEX = "CREATE INDEX IF NOT EXISTS idx_employee_name ON employee(name)"
+# Case-insensitive index so "jo" finds "John" with an index range scan (LIKE 'jo%')
+CREATE_NAME_NOCASE_INDEX = "CREATE INDEX IF NOT EXISTS idx_employee_name_nocase ON employee(name COLLATE NOCASE)"
+# id is the rowid, so this index already orders ties by id for keyset paging
+CREATE_SALARY_INDEX = "CREATE INDEX IF NOT EXISTS idx_employee_salary ON employee(salary)"
+
+# SQL is kept constant so sqlite3's per-connection statement cache reuses the prepared statements
+INSERT_SQL = "INSERT INTO employee (id, name, salary) VALUES (?, ?, ?)"
+INSERT_IGNORE_SQL = "INSERT OR IGNORE INTO employee (id, name, salary) VALUES (?, ?, ?)"
+SELECT_ALL_SQL = "SELECT id, name, salary FROM employee ORDER BY id"
+UPDATE_BOTH_SQL = "UPDATE employee SET salary = ?, name = ? WHERE name = ?"
+UPDATE_NAME_SQL = "UPDATE employee SET name = ? WHERE name = ?"
+UPDATE_SALARY_SQL = "UPDATE employee SET salary = ? WHERE name = ?"
+DELETE_SQL = "DELETE FROM employee WHERE name = ?"
+SEARCH_NAME_SQL = (
+    "SELECT id, name FROM employee WHERE name LIKE ? ESCAPE '\\' "
+    "ORDER BY name COLLATE NOCASE LIMIT ?"
+)
+SEARCH_ID_SQL = "SELECT id, name FROM employee WHERE id = ?"
+SEARCH_LIMIT = 20
+
+SORT_COLUMNS = ("id", "name", "salary")
+PAGE_SIZE = 200
+
+
+def _page_sql(sort, descending, first):
+    # Keyset pagination: continue after the last (sort value, id) seen instead of OFFSET,
+    # so every page is an index seek no matter how deep the user has scrolled
+    op, order = ("<", "DESC") if descending else (">", "ASC")
+    if sort == "id":
+        where = "" if first else f"WHERE id {op} ?"
+        order_by = f"id {order}"
+    else:
+        where = "" if first else f"WHERE ({sort}, id) {op} (?, ?)"
+        order_by = f"{sort} {order}, id {order}"
+    return f"SELECT id, name, salary FROM employee {where} ORDER BY {order_by} LIMIT ?"
+
+
+PAGE_SQL = {
+    (sort, descending, first): _page_sql(sort, descending, first)
+    for sort in SORT_COLUMNS for descending in (False, True) for first in (False, True)
+}
+
+
+def connect(path=DB_PATH):
+    conn = sqlite3.connect(path, cached_statements=256)
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    with conn:
+        conn.execute(CREATE_TABLE)
+        try:
+            conn.execute(CREATE_NAME_UNIQUE)
+        except sqlite3.IntegrityError:
+            # Older databases may already hold duplicate names; still index for lookups
+            print("⚠️ Duplicate names in employee table, using a non-unique index")
+            conn.execute(CREATE_NAME_INDEX)
+        conn.execute(CREATE_SALARY_INDEX)
+        conn.execute(CREATE_NAME_NOCASE_INDEX)
+    return conn
+
+
+class EmployeeStore:
+    # Owns the connection; lookups go through the indexes instead of an in-memory name list
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self.conn = connect(path)
+
+    # The underscore versions run inside whatever transaction is open, so DBWorker
+    # can group several writes into one commit
+    def add(self, emp_id, name, salary):
+        with self.conn:
+            return self._add(emp_id, name, salary)
+
+    def edit(self, chosen, new_name="", new_salary=""):
+        with self.conn:
+            return self._edit(chosen, new_name, new_salary)
+
+    def remove(self, chosen):
+        with self.conn:
+            return self._remove(chosen)
+
+    def _add(self, emp_id, name, salary):
+        # Checked before touching the table so a bad value can't leave a half-done write
+        emp_id, salary = int(emp_id), int(salary)
+        self.conn.execute(INSERT_SQL, (emp_id, name, salary))
+        return 1
+
+    def _edit(self, chosen, new_name="", new_salary=""):
+        if new_salary != "":
+            new_salary = int(new_salary)  # Same check as _add, before anything is written
+        if new_name != "" and new_salary != "":
+            cur = self.conn.execute(UPDATE_BOTH_SQL, (new_salary, new_name, chosen))
+        elif new_name != "":
+            cur = self.conn.execute(UPDATE_NAME_SQL, (new_name, chosen))
+        elif new_salary != "":
+            cur = self.conn.execute(UPDATE_SALARY_SQL, (new_salary, chosen))
+        else:
+            return 0
+        return cur.rowcount
+
+    def _remove(self, chosen):
+        cur = self.conn.execute(DELETE_SQL, (chosen,))
+        return cur.rowcount
+
+    def all_rows(self):
+        return self.conn.execute(SELECT_ALL_SQL).fetchall()
+
+    def page(self, sort="id", descending=False, after=None, limit=PAGE_SIZE):
+        # after is the last row of the previous page, or None for the first page
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"Cannot sort by {sort!r}")
+        sql = PAGE_SQL[(sort, descending, after is None)]
+        if after is None:
+            params = (limit,)
+        elif sort == "id":
+            params = (after[0], limit)
+        else:
+            params = (after[SORT_COLUMNS.index(sort)], after[0], limit)
+        return self.conn.execute(sql, params).fetchall()
+
+    def search(self, text, limit=SEARCH_LIMIT):
+        # Top matches for a type-ahead box: an exact ID hit first, then names by prefix
+        text = text.strip()
+        if not text:
+            return []
+        matches = []
+        if text.isdecimal():
+            matches += self.conn.execute(SEARCH_ID_SQL, (int(text),)).fetchall()
+        pattern = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        for row in self.conn.execute(SEARCH_NAME_SQL, (pattern, limit)):
+            if row not in matches:
+                matches.append(row)
+        return matches[:limit]
+
+    def close(self):
+        self.conn.close()
+
+
+# ========== WORKER THREAD ==========
+
+WRITE_METHODS = ("add", "edit", "remove")
+MAX_BATCH = 500
+_STOP = object()
+
+
+class DBWorker:
+    # A single thread owns the EmployeeStore; everything else queues commands.
+    # Results are handed back through poll(), which the GUI runs from Tk's after() loop,
+    # so callbacks always fire on the Tk thread.
+    def __init__(self, path=DB_PATH, max_batch=MAX_BATCH):
+        self.path = path
+        self.max_batch = max_batch
+        self.commands = queue.Queue()
+        self.results = queue.Queue()
+        self._ready = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="employee-db", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error:
+            raise self._error
+
+    def submit(self, method, *args, callback=None, errback=None):
+        self.commands.put((method, args, callback, errback))
+
+    def poll(self):
+        while True:
+            try:
+                func, value = self.results.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                func(value)
+            except Exception:
+                traceback.print_exc()  # Keep delivering the rest of the results
+
+    def close(self):
+        self.commands.put(_STOP)
+        self._thread.join()
+
+    def _reply(self, callback, errback, value, error):
+        if error is not None:
+            if errback:
+                self.results.put((errback, error))
+            else:
+                print(f"⚠️ Database error: {error}")
+        elif callback:
+            self.results.put((callback, value))
+
+    def _run(self):
+        try:
+            store = EmployeeStore(self.path)
+        except Exception as e:
+            self._error = e
+            self._ready.set()
+            return
+        self._ready.set()
+        carry = None
+        while True:
+            command = carry or self.commands.get()
+            carry = None
+            if command is _STOP:
+                break
+            if command[0] not in WRITE_METHODS:
+                self._read(store, command)
+                continue
+            # Pull every write already queued so they share one transaction
+            batch = [command]
+            while len(batch) < self.max_batch:
+                try:
+                    following = self.commands.get_nowait()
+                except queue.Empty:
+                    break
+                if following is _STOP or following[0] not in WRITE_METHODS:
+                    carry = following
+                    break
+                batch.append(following)
+            self._write(store, batch)
+        store.close()
+
+    def _read(self, store, command):
+        method, args, callback, errback = command
+        try:
+            value, error = getattr(store, method)(*args), None
+        except Exception as e:
+            value, error = None, e
+        self._reply(callback, errback, value, error)
+
+    def _write(self, store, batch):
+        # Each command gets a savepoint so one failure (e.g. a duplicate name)
+        # only rolls back itself, not the rest of the batch
+        replies = []
+        conn = store.conn
+        try:
+            conn.execute("BEGIN")
+            for method, args, callback, errback in batch:
+                conn.execute("SAVEPOINT command")
+                try:
+                    value, error = getattr(store, "_" + method)(*args), None
+                    conn.execute("RELEASE command")
+                except Exception as e:
+                    # Anything a command raises (bad input too) must not take the thread
+                    # down with the write lock still held
+                    conn.execute("ROLLBACK TO command")
+                    conn.execute("RELEASE command")
+                    value, error = None, e
+                replies.append((callback, errback, value, error))
+            conn.commit()
+        except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
+            replies = [(callback, errback, None, e) for _, _, callback, errback in batch]
+        for reply in replies:
+            self._reply(*reply)
+
+
+# ========== BULK CSV ==========
+# These open their own connection so they can run on a worker thread;
+# WAL mode keeps the GUI's connection readable while they work.
+
+CSV_HEADER = ("id", "name", "salary")
+CHUNK_SIZE = 50_000
+
+
+def _counted_lines(raw, counter):
+    for line in raw:
+        counter[0] += len(line)
+        yield line.decode("utf-8-sig")
+
+
+def import_csv(csv_path, db_path=DB_PATH, chunk_size=CHUNK_SIZE, progress=None):
+    # Streams the file in chunks into one transaction. Rows whose id or name already
+    # exist are skipped and counted rather than aborting the import.
+    # progress(fraction) is called after every chunk.
+    total_bytes = os.path.getsize(csv_path) or 1
+    read_bytes = [0]
+    summary = {"inserted": 0, "duplicates": 0, "invalid": 0}
+    conn = connect(db_path)
+    try:
+        with open(csv_path, "rb") as raw, conn:
+            reader = csv.reader(_counted_lines(raw, read_bytes))
+            reader = (row for row in reader if any(field.strip() for field in row))  # Skip blank lines
+            first = next(reader, None)
+            if first is None:
+                return summary
+            header = [col.strip().lower() for col in first]
+            if set(CSV_HEADER) <= set(header):
+                order = [header.index(col) for col in CSV_HEADER]
+                pending = []
+            else:
+                order = [0, 1, 2]
+                pending = [first]
+
+            def flush(rows):
+                before = conn.total_changes
+                conn.executemany(INSERT_IGNORE_SQL, rows)
+                inserted = conn.total_changes - before
+                summary["inserted"] += inserted
+                summary["duplicates"] += len(rows) - inserted
+                if progress:
+                    progress(read_bytes[0] / total_bytes)
+
+            chunk = []
+            for row in itertools.chain(pending, reader):
+                try:
+                    chunk.append((int(row[order[0]]), row[order[1]].strip(), int(row[order[2]])))
+                except (IndexError, ValueError):
+                    summary["invalid"] += 1
+                    continue
+                if len(chunk) >= chunk_size:
+                    flush(chunk)
+                    chunk = []
+            if chunk:
+                flush(chunk)
+    finally:
+        conn.close()
+    if progress:
+        progress(1.0)
+    return summary
+
+
+def export_csv(csv_path, db_path=DB_PATH, chunk_size=CHUNK_SIZE, progress=None):
+    conn = connect(db_path)
+    try:
+        total = conn.execute("SELECT COUNT(*) FROM employee").fetchone()[0] or 1
+        written = 0
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADER)
+            cur = conn.execute(SELECT_ALL_SQL)
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if not rows:
+                    break
+                writer.writerows(rows)
+                written += len(rows)
+                if progress:
+                    progress(written / total)
+    finally:
+        conn.close()
+    if progress:
+        progress(1.0)
+    return written
@@ -55,6 +55,8 @@ CONFIG = {
     "stop_loss": 0.9,
     "check_interval": 2,
     "auto_sell_delay": 300,
+    "price_refresh_interval": 30,
+    "max_price_age": 120,  # Seconds before the cached SOL price is too old to trade on
 }
 
 RATE_LIMIT = 5
@@ -64,7 +66,7 @@ semaphore = asyncio.Semaphore(1)  #To prevents 429 errors.
 SOL_MINT = WRAPPED_SOL_MINT
 seen = set()
 
-CURRENT_SOL = 0
+sol_price = None
 keypair = None
 pubkey = None
 client = None
@@ -168,22 +170,109 @@ async def request_airdrop_with_retry(client: AsyncClient, pubkey: Pubkey, lampor
     raise Exception("Max retries exceeded for airdrop")
 
 
-def get_sol_price():
-    try:
-        r = requests.get("https://price.jup.ag/v4/price?ids=SOL", timeout=5)
-        r.raise_for_status()
-        price = r.json()["data"]["SOL"]["price"]
-        print(f"Got SOL price from Jupiter: {price}")
-        logger.warning(f"Got SOL price from Jupiter: {price}")          #Gets current price of native SOL
-        return price
-    except Exception:
-        print("🔁 Falling back to CoinGecko.")
-        logger.warning("Falling back to CoinGecko.")
-        fallback = requests.get("https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd")
-        price = fallback.json()['solana']['usd']
-        print(f"Got SOL price from CoinGecko fallback: {price}")
-        logger.warning(f"Got SOL price from CoinGecko fallback: {price}")
-        return price
+JUPITER_PRICE_URL = "https://price.jup.ag/v4/price?ids=SOL"
+COINGECKO_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd"
+
+
+async def fetch_jupiter_sol_price(session):
+    async with session.get(JUPITER_PRICE_URL) as resp:
+        resp.raise_for_status()
+        data = await resp.json()
+        return float(data["data"]["SOL"]["price"]), "Jupiter"
+
+
+async def fetch_coingecko_sol_price(session):
+    async with session.get(COINGECKO_PRICE_URL) as resp:
+        resp.raise_for_status()
+        data = await resp.json()
+        return float(data["solana"]["usd"]), "CoinGecko"
+
+
+class SolPriceCache:
+    #Keeps the native SOL price fresh in the background. Reads are just attribute lookups.
+    def __init__(self, refresh_interval=30, max_age=120, timeout=5):
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.timeout = timeout
+        self.price = None
+        self.source = None
+        self.updated_at = None  # time.monotonic() of the last good price
+        self._task = None
+        self._session = None
+        self._ready = asyncio.Event()
+
+    @property
+    def age(self):
+        if self.updated_at is None:
+            return float("inf")
+        return time.monotonic() - self.updated_at
+
+    @property
+    def is_stale(self):
+        return self.age > self.max_age
+
+    def get(self):
+        return self.price, self.age
+
+    async def refresh(self):
+        #Ask every source at once and keep the first good answer
+        fetches = [
+            asyncio.create_task(fetch_jupiter_sol_price(self._session)),
+            asyncio.create_task(fetch_coingecko_sol_price(self._session)),
+        ]
+        try:
+            for next_done in asyncio.as_completed(fetches, timeout=self.timeout):
+                try:
+                    price, source = await next_done
+                except asyncio.TimeoutError:
+                    raise  # The whole refresh ran out of time, not just this source
+                except Exception as e:
+                    print(f"⚠️ SOL price source failed: {e}")
+                    logger.warning(f"SOL price source failed: {e}")
+                    continue
+                if price > 0:
+                    self.price, self.source = price, source
+                    self.updated_at = time.monotonic()
+                    self._ready.set()
+                    print(f"Got SOL price from {source}: {price}")
+                    logger.warning(f"Got SOL price from {source}: {price}")
+                    return price
+        except asyncio.TimeoutError:
+            print("⚠️ SOL price refresh timed out")
+            logger.warning("SOL price refresh timed out")
+        finally:
+            for task in fetches:
+                task.cancel()
+        print(f"❌ No SOL price source answered, cached price is {self.age:.0f}s old")
+        logger.warning(f"No SOL price source answered, cached price is {self.age:.0f}s old")
+        return None
+
+    async def _run(self):
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_interval)
+
+    async def start(self, wait_timeout=None):
+        if self._task is None:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._task = asyncio.create_task(self._run())
+        try:
+            await asyncio.wait_for(self._ready.wait(), wait_timeout)
+        except asyncio.TimeoutError:
+            print("⚠️ No SOL price yet, trades will be refused until one arrives")
+            logger.warning("No SOL price yet, trades will be refused until one arrives")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
 
 def jupiter_quote(input_mint, output_mint, amount):
@@ -221,11 +310,19 @@ def jupiter_swap(quote):
     return r.json()["swapTransaction"]
 
 
-async def execute_swap(input_mint, output_mint, amount):
+async def execute_swap(input_mint, output_mint, amount, exit_trade=False):
     print(f"🛠️ Swapping {amount} {input_mint} → {output_mint}")
     logger.warning(f"Swapping {amount} {input_mint} → {output_mint}")
+    current_sol, price_age = sol_price.get()
+    if sol_price.is_stale and not exit_trade:
+        print(f"⏳ SOL price is stale ({price_age:.0f}s old), refusing to swap")
+        logger.warning(f"SOL price is stale ({price_age:.0f}s old), refusing to swap")
+        return None
     quote = jupiter_quote(input_mint, output_mint, amount)
-    usd_value = (quote["inAmount"] / 1e9) * (quote["outAmount"] / quote["inAmount"]) * CURRENT_SOL      #Swaps
+    if current_sol is None:  # Only possible on exits: never leave a position stuck on the price feed
+        usd_value = float("inf")
+    else:
+        usd_value = (quote["inAmount"] / 1e9) * (quote["outAmount"] / quote["inAmount"]) * current_sol      #Swaps
 
     if usd_value < 500:
         print(f"💧 Insufficient liquidity: ${usd_value:.2f}")
@@ -263,13 +360,17 @@ async def monitor_trade(output_mint, entry_quote):
             if price >= entry_price * CONFIG["take_profit"]:
                 print("🎯 Take profit hit!")
                 logger.warning("Take profit hit!")
-                await execute_swap(output_mint, entry_quote["inputMint"], entry_quote["outAmount"] / 1e9)
-                return
+                if await execute_swap(output_mint, entry_quote["inputMint"], entry_quote["outAmount"] / 1e9, exit_trade=True):
+                    return
+                print("⚠️ Sell did not go through, retrying next check")
+                logger.warning("Sell did not go through, retrying next check")
             if price <= entry_price * CONFIG["stop_loss"]:
                 print("💔 Stop loss triggered.")
                 logger.warning("Stop loss triggered.")
-                await execute_swap(output_mint, entry_quote["inputMint"], entry_quote["outAmount"] / 1e9)
-                return
+                if await execute_swap(output_mint, entry_quote["inputMint"], entry_quote["outAmount"] / 1e9, exit_trade=True):
+                    return
+                print("⚠️ Sell did not go through, retrying next check")
+                logger.warning("Sell did not go through, retrying next check")
         except Exception as e:
             print("⚠️ Error in monitor:", e)
             logger.warning(f"Error in monitor: {e}")
@@ -377,7 +478,7 @@ async def listen_for_transactions():
 
 
 async def main():
-    global keypair, pubkey, client, CURRENT_SOL
+    global keypair, pubkey, client, sol_price
     secret_json_str = os.getenv("WALLET_SECRET_JSON")
     if not secret_json_str:
         raise Exception("WALLET_SECRET_JSON environment variable not set")
@@ -388,9 +489,10 @@ async def main():
     pubkey = keypair.pubkey()
     client = AsyncClient(CONFIG["rpc"], commitment=Confirmed)    #Executes everything.
 
-    CURRENT_SOL = get_sol_price()
-    print(f"Current SOL price set to {CURRENT_SOL}")
-    logger.warning(f"Current SOL price set to {CURRENT_SOL}")
+    sol_price = SolPriceCache(CONFIG["price_refresh_interval"], CONFIG["max_price_age"])
+    await sol_price.start(wait_timeout=10)
+    print(f"Current SOL price set to {sol_price.price}")
+    logger.warning(f"Current SOL price set to {sol_price.price}")
 
     # Optionally request airdrop if balance is low - example usage
     balance_resp = await client.get_balance(pubkey)
@@ -403,7 +505,10 @@ async def main():
         else:
             print("Balance low. Please fund!")
             logger.warning("Balance low. Please fund!")
-    await listen_for_transactions()
+    try:
+        await listen_for_transactions()
+    finally:
+        await sol_price.stop()
 
 
 if __name__ == "__main__":